@@ -48,7 +48,7 @@ __manifest__ : Manifest = Manifest(
 )
 
 # This manifest is defined as a project manifest. By doing this, this module will become the project root.
-__project_manifest__ = __manifest__
+__project_manifest__ = Manifest.registerProject(__manifest__)
 
 # Set the parent manifest for the manifest module
 import pylium.manifest.__header__ as manifest_header_module
@@ -170,7 +170,7 @@ class Header(ABC, metaclass=HeaderMeta):
 
    
     def __init__(self, *args, **kwargs):
-        logger.debug(f"Component __init__: {self.__class__.__name__} called with args: {args}, kwargs: {kwargs}")
+        logger.debug("Component __init__: %s called with args: %s, kwargs: %s", self.__class__.__name__, args, kwargs)
         # Since Header is a direct subclass of ABC, and ABC.__init__ (which is object.__init__)
         # does not accept arbitrary *args, **kwargs, we call super().__init__() without them
         # to prevent the TypeError. Subclasses of Header are responsible for handling
@@ -179,7 +179,7 @@ class Header(ABC, metaclass=HeaderMeta):
 
 
     def __new__(cls, *args, **kwargs):
-        logger.debug(f"Component __new__: {cls.__name__} called with args: {args}, kwargs: {kwargs}")
+        logger.debug("Component __new__: %s called with args: %s, kwargs: %s", cls.__name__, args, kwargs)
    
         actual_class_to_instantiate = cls._find_impl()
 
@@ -190,13 +190,13 @@ class Header(ABC, metaclass=HeaderMeta):
                 f"or the class is a Bundle/Impl type."
             )
 
-        logger.debug(f"  Actual class to instantiate determined by __new__ for {cls.__name__} is: {actual_class_to_instantiate.__name__}")
+        logger.debug("  Actual class to instantiate determined by __new__ for %s is: %s", cls.__name__, actual_class_to_instantiate.__name__)
         instance = super().__new__(actual_class_to_instantiate)
         return instance
 
 
     def __init_subclass__(cls, **kwargs):
-        logger.debug(f"Component __init_subclass__: {cls.__name__}")
+        logger.debug("Component __init_subclass__: %s", cls.__name__)
 
         super().__init_subclass__(**kwargs)
 
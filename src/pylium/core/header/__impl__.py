@@ -24,13 +24,13 @@ class HeaderImpl(Header):
         'cls' here is HeaderImpl itself.
         """
 
-        logger.debug(f"  HeaderImpl._find_impl searching for implementation of: {specific_header_cls.__name__} @ {specific_header_cls.__module__}")
+        logger.debug("  HeaderImpl._find_impl searching for implementation of: %s @ %s", specific_header_cls.__name__, specific_header_cls.__module__)
 
         # Manual __implementation__ string on the specific_header_cls takes precedence
         # This attribute should be on the actual header class (e.g., MyModuleH.__implementation__)
         explicit_impl_fqn = getattr(specific_header_cls, '__implementation__', None)
         if explicit_impl_fqn:
-            logger.debug(f"  {specific_header_cls.__name__} has manual implementation setting: {explicit_impl_fqn}")
+            logger.debug("  %s has manual implementation setting: %s", specific_header_cls.__name__, explicit_impl_fqn)
             if not isinstance(explicit_impl_fqn, str):
                 raise TypeError(f"__implementation__ attribute on {specific_header_cls.__name__} must be a string FQN.")
             
@@ -50,7 +50,7 @@ class HeaderImpl(Header):
                          f"Explicitly specified implementation class {explicit_impl_fqn} "
                          f"for {specific_header_cls.__name__} must be a subclass of Header."
                      )
-                logger.debug(f"  Successfully loaded and validated explicit implementation: {loaded_impl_class.__name__}")
+                logger.debug("  Successfully loaded and validated explicit implementation: %s", loaded_impl_class.__name__)
                 return loaded_impl_class
             except (ImportError, AttributeError, ValueError) as e: # ValueError for rsplit if not a valid FQN
                 raise RuntimeError(
@@ -61,15 +61,15 @@ class HeaderImpl(Header):
         header_cls_type = getattr(specific_header_cls, '__class_type__', None)
 
         if header_cls_type == Header.ClassType.Bundle:
-            logger.debug(f"  {specific_header_cls.__name__} is a Bundle, it is its own implementation.")
+            logger.debug("  %s is a Bundle, it is its own implementation.", specific_header_cls.__name__)
             return specific_header_cls
         
         elif header_cls_type == Header.ClassType.Impl:
-            logger.debug(f"  {specific_header_cls.__name__} is an Impl, it is its own implementation.")
+            logger.debug("  %s is an Impl, it is its own implementation.", specific_header_cls.__name__)
             return specific_header_cls
         
         elif header_cls_type == Header.ClassType.Header:
-            logger.debug(f"  {specific_header_cls.__name__} is a Header, finding implementation by convention...")
+            logger.debug("  %s is a Header, finding implementation by convention...", specific_header_cls.__name__)
 
             # Step 1: Determine the target implementation module name (using specific_header_cls)
             target_impl_module_fqn = None
@@ -104,14 +104,14 @@ class HeaderImpl(Header):
                 logger.error(f"  Could not determine module file for {specific_header_cls.__name__}: {e}. Cannot find implementation by convention.")
                 return None 
 
-            logger.debug(f"  Target FQN for convention-based implementation module: {target_impl_module_fqn}")
+            logger.debug("  Target FQN for convention-based implementation module: %s", target_impl_module_fqn)
 
             # Step 2: Import the target module and find the Impl class
             found_impl_class_by_convention = None
             if target_impl_module_fqn:
                 try:
                     imported_module = importlib.import_module(target_impl_module_fqn)
-                    logger.debug(f"  Successfully imported target convention module: {target_impl_module_fqn}")
+                    logger.debug("  Successfully imported target convention module: %s", target_impl_module_fqn)
 
                     for name, obj in inspect.getmembers(imported_module):
                         # Use specific_header_cls as the base for subclass check
@@ -126,7 +126,7 @@ class HeaderImpl(Header):
                                     f"{found_impl_class_by_convention.__name__} and {obj.__name__}. Using the first one found."
                                 )
                             else:
-                                logger.debug(f"    Found matching convention-based Impl class: {obj.__module__}.{obj.__name__}")
+                                logger.debug("    Found matching convention-based Impl class: %s.%s", obj.__module__, obj.__name__)
                                 found_impl_class_by_convention = obj
                 
                 except ImportError:
@@ -158,7 +158,7 @@ class HeaderImpl(Header):
                     f"3. Or, if '{specific_header_cls.__name__}' is intended to be a self-contained component (without a separate Impl), \\n"
                     f"   change its '__class_type__' attribute to 'Header.ClassType.Bundle'."
                 )
-                logger.debug(f"No convention-based Impl found for Header '{header_class_fqn}'. Search was in '{target_impl_module_fqn}'. Raising RuntimeError.")
+                logger.debug("No convention-based Impl found for Header '%s'. Search was in '%s'. Raising RuntimeError.", header_class_fqn, target_impl_module_fqn)
                 raise RuntimeError(error_message)
         
         raise RuntimeError(f"Header {specific_header_cls.__name__} has an undefined __class_type__ or unhandled case in _find_impl.")
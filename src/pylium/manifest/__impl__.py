@@ -1,13 +1,14 @@
 # Pylium imports
 from .types import ManifestTypes
+from ._imports import fast_import
 
 # Standard library imports
-from typing import ClassVar, List, Optional, Any, Callable, Dict, Annotated
-from types import FunctionType
-import importlib.machinery
-import importlib.util
-import pkgutil
-import inspect
+from typing import ClassVar, List, Optional, Any, Callable, Dict, Set, Tuple, Annotated
+from types import FunctionType, FrameType, ModuleType
+from functools import cached_property
+from itertools import chain
+from operator import attrgetter
+import os
 import sys
 import threading
 
@@ -22,6 +23,113 @@ logger = getLogger(__name__)
 # Import manifest header module at module level to avoid thread safety issues with imports
 import pylium.manifest.__header__ as manifest_header_module
 
+# Set PYLIUM_DEBUG_MANIFEST=1 to log the caller of every Manifest creation
+_DEBUG_MANIFEST = os.environ.get("PYLIUM_DEBUG_MANIFEST", "") not in ("", "0")
+
+# Marks lazily resolved values that have not been resolved yet
+_SENTINEL = object()
+
+# Sort version of manifests without changelog, Version objects are immutable so one is enough
+_ZERO_VERSION = Version("0")
+
+# Reads the name of authors and maintainers
+_GET_NAME = attrgetter("name")
+
+# Sort key of child manifests, children are listed by their short fully qualified name
+_FQN_SHORT_KEY = attrgetter("location.fqnShort")
+
+# Guards the lazy parent resolution, which only happens once per manifest
+_PARENT_RESOLVE_LOCK = threading.Lock()
+
+# Guards the child and project registries together with the sorted tuples built from them.
+# Taken while holding _PARENT_RESOLVE_LOCK, never the other way around
+_REGISTRY_LOCK = threading.Lock()
+
+# Packages whose header submodules have already been imported
+_HEADER_SCANNED_PACKAGES: Set[str] = set()
+
+# Project manifests registered with Manifest.registerProject(), listed under the root manifest
+_PROJECT_MANIFESTS: List["Manifest"] = []
+
+# The registered project manifests sorted as the root manifest lists them, rebuilt on registration
+_SORTED_PROJECT_MANIFESTS: Tuple["Manifest", ...] = ()
+
+
+def _sorted_by_fqn(manifests) -> Tuple["Manifest", ...]:
+    """Sort manifests by their short fully qualified name, leaving out those without a location yet."""
+    return tuple(sorted((manifest for manifest in manifests if manifest.location is not None), key=_FQN_SHORT_KEY))
+
+
+def _import_headers(package: ModuleType) -> None:
+    """Import the __header__ and *_h submodules of a package, once per package."""
+    if package.__name__ in _HEADER_SCANNED_PACKAGES:
+        return
+
+    # Only needed when the manifest tree is traversed
+    import pkgutil
+
+    for finder, name, ispkg in pkgutil.iter_modules(package.__path__):
+        header : str = None
+        if ispkg:
+            # its a package, find the __header__ submodule  
+            header = f"{package.__name__}.{name}.__header__"
+
+        elif name.endswith("_h"):
+            header = f"{package.__name__}.{name}"
+
+        if header:
+            try:
+                fast_import(header)
+            except ImportError as e:
+                pass
+
+    _HEADER_SCANNED_PACKAGES.add(package.__name__)
+
+
+class CallerInfo:
+    """Information about the frame a Manifest was created from."""
+
+    def __init__(self, frame: FrameType):
+        self.module_name: str = frame.f_globals.get('__name__', 'unknown')
+        self.module: Optional[object] = sys.modules.get(self.module_name)
+        self.function: str = frame.f_code.co_name
+        self.qualname: str = frame.f_code.co_qualname
+
+        self.classname: Optional[str] = None
+        self.is_method: bool = False
+        self.is_class_scope: bool = False
+        self.is_module_scope: bool = self.qualname == "<module>"
+
+        if "self" in frame.f_locals:
+            self.classname = type(frame.f_locals["self"]).__name__
+            self.is_method = True
+        elif "cls" in frame.f_locals:
+            self.classname = frame.f_locals["cls"].__name__
+            self.is_method = True
+        elif "__module__" in frame.f_locals:
+            # we're in a class body (definition time)
+            self.classname = self.qualname
+            self.is_class_scope = True
+
+    def as_dict(self):
+        return {
+            "module": self.module_name,
+            "class": self.classname,
+            "function": self.function,
+            "qualname": self.qualname,
+            "is_method": self.is_method,
+            "is_class_scope": self.is_class_scope,
+            "is_module_scope": self.is_module_scope,
+        }
+
+    def __str__(self):
+        parts = [f"[{self.module_name}]"]
+        if self.classname:
+            parts.append(f"class {self.classname}")
+        if self.function and self.function != "<module>":
+            parts.append(f"def {self.function}()")
+        return " → ".join(parts)
+
 
 class Manifest(ManifestTypes.XObject, ManifestTypes):
     """
@@ -55,8 +163,8 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
     The manifest for a module, class, or function is defined in the module or class header
     and called __manifest__.
 
-    Now in the root "a", set __project_manifest__ = __manifest__, this marks the root
-    manifest for the project.
+    Now in the root "a", set __project_manifest__ = Manifest.registerProject(__manifest__),
+    this marks the root manifest for the project.
     
     In the module "a.b", import the manifest from the root "a" and set
     __parent_manifest__ = __manifest__, this marks the parent manifest for the module.
@@ -99,6 +207,7 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
     # Usually here in header classes the manifest is defined
     __manifest__: ClassVar["Manifest"] = None
     __root_manifest__: ClassVar["Manifest"] = None
+    __fqn_index__: ClassVar[Dict[str, "Manifest"]] = {}
 
     # Pydantic fields
     location: Optional[ManifestTypes.Location] = Field(default=None, description="Location information for this manifest")
@@ -131,14 +240,20 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
                 if hasattr(func, '__qualname__') and '.' in func.__qualname__:
                     # It's a method, get the class name
                     classname = func.__qualname__.split(".")[0]
-                    #print(f"  METHOD: {func.__qualname__} {classname}")
-                    #manifest.location = Manifest.Location(module=func.__module__, classname=classname, funcname=func.__name__)
-                #else:
-                    # It's a regular function, explicitly set classname to None
+                # For regular functions classname stays None
                 manifest.location = Manifest.Location(module=func.__module__, classname=classname, funcname=func.__name__)
 
+                # Drop the values cached while the location was unknown
+                manifest.__dict__.pop("objectType", None)
+                manifest.__dict__.pop("parent_bak", None)
+                manifest._init_identity()
+
+                # The manifest was registered without a location, index it now
+                if manifest._parent is not None:
+                    with _REGISTRY_LOCK:
+                        manifest._parent._index_child(manifest)
+
             # Attach manifest
-            #print(f"  ATTACHING MANIFEST: {manifest.location.fqnShort}")
             func.__manifest__ = manifest
             return func
         return decorator
@@ -150,25 +265,42 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         if not path:
             return current_manifest
         
+        # Absolute paths of already registered manifests can be resolved directly, as long
+        # as the indexed manifest is the one the walk from the root would find
+        if search_base is None:
+            found = Manifest.__fqn_index__.get(path)
+            if found is not None and found._reaches_root():
+                return found
+
         object_path_parts = path.split(".")
         current_path = ""
 
         for part in object_path_parts:
             current_path += f".{part}" if current_path else part
             # Search in children, not attributes
-            found = None
-            for child in current_manifest.children:
-                if (child.location.fqnShort == current_path):
-                    found = child
-                    break
+            found = current_manifest._get_child(current_path)
             if not found:
-                print(f"  MANIFEST NOT FOUND: {current_path}")
+                logger.debug("Manifest not found: %s", current_path)
                 return None
             current_manifest = found
        
         return current_manifest
 
 
+    @classmethod
+    def registerProject(cls, manifest: "Manifest") -> "Manifest":
+        """
+        Register a project manifest, so it is listed as a child of the root manifest.
+        Returns the manifest to allow: __project_manifest__ = Manifest.registerProject(__manifest__)
+        """
+        global _SORTED_PROJECT_MANIFESTS
+        with _REGISTRY_LOCK:
+            if not any(project is manifest for project in _PROJECT_MANIFESTS):
+                _PROJECT_MANIFESTS.append(manifest)
+                _SORTED_PROJECT_MANIFESTS = _sorted_by_fqn(_PROJECT_MANIFESTS)
+        return manifest
+
+
     def __init__(self,
                 parent: "Manifest",
                 location: Optional[ManifestTypes.Location] = None,
@@ -190,159 +322,143 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         """Initialize a new Manifest instance."""
 
 
-        class CallerInfo:
-            from types import FrameType
-
-            def __init__(self, frame: FrameType):
-                self.module_name: str = frame.f_globals.get('__name__', 'unknown')
-                self.module: Optional[object] = sys.modules.get(self.module_name)
-                self.function: str = frame.f_code.co_name
-                self.qualname: str = frame.f_code.co_qualname
-
-                self.classname: Optional[str] = None
-                self.is_method: bool = False
-                self.is_class_scope: bool = False
-                self.is_module_scope: bool = self.qualname == "<module>"
-
-                if "self" in frame.f_locals:
-                    self.classname = type(frame.f_locals["self"]).__name__
-                    self.is_method = True
-                elif "cls" in frame.f_locals:
-                    self.classname = frame.f_locals["cls"].__name__
-                    self.is_method = True
-                elif "__module__" in frame.f_locals:
-                    # we're in a class body (definition time)
-                    self.classname = self.qualname
-                    self.is_class_scope = True
-
-            def as_dict(self):
-                return {
-                    "module": self.module_name,
-                    "class": self.classname,
-                    "function": self.function,
-                    "qualname": self.qualname,
-                    "is_method": self.is_method,
-                    "is_class_scope": self.is_class_scope,
-                    "is_module_scope": self.is_module_scope,
-                }
-
-            def __str__(self):
-                parts = [f"[{self.module_name}]"]
-                if self.classname:
-                    parts.append(f"class {self.classname}")
-                if self.function and self.function != "<module>":
-                    parts.append(f"def {self.function}()")
-                return " → ".join(parts)
-
-
-        frame = inspect.currentframe().f_back
-        info = CallerInfo(frame)
-        print(info)
-        
-        # --- Function ---
-#        func_name = frame.f_code.co_name
-
-        # --- Class ---
-#        cls_name = None
-        # Check if 'self' or 'cls' is in local variables
-#        if 'self' in frame.f_locals:
-#            cls_name = type(frame.f_locals['self']).__name__
-#        elif 'cls' in frame.f_locals:
-#            cls_name = frame.f_locals['cls'].__name__
-
-#        print({
-#            "module": frame.f_globals.get("__name__", None),
-#            "function": frame.f_code.co_name,
-#            "class": type(frame.f_locals.get("self", None)).__name__ if "self" in frame.f_locals else None,
-#        })
-
-        # Store basic info
-        #self.description = description
-        self._children = []
-        self._children_lock = threading.Lock()
-        
-        #
-        
-
-        # Detect context and set pointer
-        if 'locals' in frame.f_locals and '__module__' in frame.f_locals:
-            # We're in a class definition
-            print(f"  CLASS: {frame.f_code.co_name}")
-#            self._context = 'class'
-
-#            self._ptr = frame.f_locals['locals']  # The class being defined
-            #self.fqn = f"{module_name}.{frame.f_code.co_name}"
-            pass
-            
-        elif frame.f_code.co_name != '<module>':
-            # We're in a function/method
-#            self._context = 'function'
-#            self._ptr = frame.f_code  # The function object
-            
-            # Get full qualified name including class if we're in a method
-            if 'self' in frame.f_locals:
-                #print(f"  METHOD: {frame.f_code.co_name}")
-                #cls_name = frame.f_locals['self'].__class__.__name__
-                #self.fqn = f"{module_name}.{cls_name}.{frame.f_code.co_name}"
-                pass
-            else:
-
-                #self.fqn = f"{module_name}.{frame.f_code.co_name}"
-                pass
-                
-        else:
-            # We're at module level
-#            self._context = 'module'
-#            self._ptr = module
-            #self.fqn = module_name
-            pass
+        # Caller introspection is costly, only do it when explicitly requested
+        if _DEBUG_MANIFEST:
+            info = CallerInfo(sys._getframe(1))
+            logger.debug("%s", info)
 
         # Inherit from parent if not provided
-        if parent:
+        if parent is not None:
             #self.description = parent.description
             #self.changelog = parent.changelog
             #self.dependencies = parent.dependencies
-            authors = parent.authors if authors is None else authors
-            maintainers = parent.maintainers if maintainers is None else maintainers
-            copyright = parent.copyright if copyright is None else copyright
-            license = parent.license if license is None else license
-            status = parent.status if status is None else status
-            accessMode = parent.accessMode if accessMode is None else accessMode
-            aiAccessLevel = parent.aiAccessLevel if aiAccessLevel is None else aiAccessLevel
-            threadSafety = parent.threadSafety if threadSafety is None else threadSafety
-            frontend = parent.frontend if frontend is None else frontend
-            backend = parent.backend if backend is None else backend
-
-
-        # Initialize Pydantic model with all fields
-        super().__init__(
-            location=location,
-            description=description,
-            changelog=changelog if changelog is not None else [],
-            dependencies=dependencies if dependencies is not None else [],
-            authors=authors if authors is not None else ManifestTypes.AuthorList(authors=[]),
-            maintainers=maintainers if maintainers is not None else None,  # Will use authors if None
-            copyright=copyright,
-            license=license,
-            status=status,
-            accessMode=accessMode,
-            aiAccessLevel=aiAccessLevel,
-            threadSafety=threadSafety,
-            frontend=frontend,
-            backend=backend,
-            additionalInfo=kwargs
-        )
+            # Pydantic keeps the validated fields in __dict__, read them from there directly
+            pd = parent.__dict__
+            authors = pd["authors"] if authors is None else authors
+            maintainers = pd["maintainers"] if maintainers is None else maintainers
+            copyright = pd["copyright"] if copyright is None else copyright
+            license = pd["license"] if license is None else license
+            status = pd["status"] if status is None else status
+            accessMode = pd["accessMode"] if accessMode is None else accessMode
+            aiAccessLevel = pd["aiAccessLevel"] if aiAccessLevel is None else aiAccessLevel
+            threadSafety = pd["threadSafety"] if threadSafety is None else threadSafety
+            frontend = pd["frontend"] if frontend is None else frontend
+            backend = pd["backend"] if backend is None else backend
+
+
+        # Initialize Pydantic model, optional fields left out fall back to the field defaults
+        data = {
+            "location": location,
+            "description": description,
+            "status": status,
+            "accessMode": accessMode,
+            "aiAccessLevel": aiAccessLevel,
+            "threadSafety": threadSafety,
+            "frontend": frontend,
+        }
+        if changelog is not None:
+            data["changelog"] = changelog
+        if dependencies is not None:
+            data["dependencies"] = dependencies
+        if authors is not None:
+            data["authors"] = authors
+        if maintainers is not None:
+            data["maintainers"] = maintainers  # Will use authors if None
+        if copyright is not None:
+            data["copyright"] = copyright
+        if license is not None:
+            data["license"] = license
+        if backend is not None:
+            data["backend"] = backend
+        super().__init__(**data, additionalInfo=kwargs)
         
         # Set maintainers to authors if not provided
         if self.maintainers is None:
             self.maintainers = self.authors
         
-        self._parent_lock = threading.Lock()
-        self._parent = parent
+        # Internal state lives directly in the instance __dict__ so reads stay plain
+        # attribute lookups and writes skip BaseModel.__setattr__
+        self.__dict__.update(
+            _parent=parent,
+            _parent_resolved=parent is not None,
+            _project_cache=_SENTINEL,
+            _children=[],
+            _children_tuple=None,
+            _children_seen=set(),
+            _children_by_fqn={},
+            _children_discovered=False,
+        )
+        self._init_identity()
+
+        # Children register themselves with their parent on creation
+        if parent is not None:
+            parent._register_child(self)
+
+        """Precompute the fully qualified name, hash, sort key and str/repr used for identity, all from one version string."""
+    def _init_identity(self) -> None:
+        """Precompute the fully qualified name, version string, hash, sort key and str/repr used for identity."""
+        fqn = self.location.fqn if self.location else None
+        version = self.version if self.changelog else None
+        version_str = str(version) if self.changelog else "N/A"
+        self.__dict__.update(
+            _fqn=fqn,
+            _cmp_key=(fqn, version.version if self.changelog else _ZERO_VERSION),
+            _fqn_hash=hash((fqn, version_str)),
+            _str_cache=f"{fqn} (v{version_str})",
+            _repr_cache=f"Manifest({fqn}, version='{version_str}', authors={len(self.authors) if self.authors else 0})",
+        )
+
+
+    def _register_child(self, child: "Manifest") -> None:
+        """Register a child manifest with this manifest."""
+        # Dedup on identity, a manifest is only ever listed once under its parent
+        child_id = id(child)
+        with _REGISTRY_LOCK:
+            if child_id in self._children_seen:
+                return
+            self._children_seen.add(child_id)
+            self._children.append(child)
+            self._index_child(child)
+
+
+    def _index_child(self, child: "Manifest") -> None:
+        """Index a registered child manifest by its short fully qualified name and list it in children, holding _REGISTRY_LOCK."""
+        if child.location is None:
+            # Indexed and listed once Manifest.func() sets the location
+            return
+        fqn_short = child.location.fqnShort
+        indexed = Manifest.__fqn_index__.get(fqn_short)
+        if indexed is not None and indexed is not child:
+            # E.g. a reloaded module, the newer manifest replaces the indexed one
+            logger.warning("Manifest %s registered more than once, replacing the indexed one", fqn_short)
+        self._children_by_fqn[fqn_short] = child
+        Manifest.__fqn_index__[fqn_short] = child
+        self._children_tuple = None
+
+
+    def _reaches_root(self) -> bool:
+        """Check if the parent chain leads to a project listed under the root manifest."""
+        root = Manifest.__root_manifest__
+        top = None
+        mod = self
+        while mod is not None and mod is not root:
+            top = mod
+            mod = mod.parent
+        return mod is not None and top is not None and any(project is top for project in root.children)
+
+
+    def _get_child(self, fqnShort: str) -> Optional["Manifest"]:
+        """Get a direct child manifest by its short fully qualified name."""
+        if self.isRoot:
+            # The root only lists the few top level projects
+            return next((child for child in self.children if child.location.fqnShort == fqnShort), None)
+        if not self._children_discovered:
+            self._discover_children()
+        return self._children_by_fqn.get(fqnShort)
 
 
     @computed_field
-    @property
+    @cached_property
     def objectType(self) -> ManifestTypes.ObjectType:
         """Determine the object type based on the location."""
         object_type = ManifestTypes.ObjectType.Invalid
@@ -376,44 +492,50 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         - Special case: manifest module uses __parent_manifest__
         
         Thread Safety:
-        - Uses a class-level lock for parent resolution
+        - Uses a module-level lock for parent resolution
         - Import of manifest_header_module is done at module level
         - Parent resolution is atomic
         """
         # Fast path - if parent is set, return it (no lock needed as it's immutable after init)
-        if self._parent is not None:
+        if self._parent is not None or self._parent_resolved:
             return self._parent
 
         # Slow path - resolve parent with proper locking
-        with self._parent_lock:
+        with _PARENT_RESOLVE_LOCK:
             # Check again in case another thread set it while we were waiting
-            if self._parent is not None:
+            if self._parent is not None or self._parent_resolved:
                 return self._parent
                 
             # Check if this is the manifest module's manifest
-            if self == manifest_header_module.__manifest__:
+            if self is manifest_header_module.__manifest__:
                 # Get parent manifest atomically under the lock
                 self._parent = getattr(manifest_header_module, "__parent_manifest__", None)
+                if self._parent is not None:
+                    self._parent._register_child(self)
                 return self._parent
-            
+
+            # Only the manifest module's manifest gets its parent assigned later on
+            self._parent_resolved = True
             return None
 
     @computed_field
-    @property
+    @cached_property
     def parent_bak(self) -> Optional["Manifest"]:
         """
         Dynamically determine the parent manifest based on the location.
         For module manifests, looks for parent module's manifest.
         For class manifests, looks for containing module's manifest.
+        The result is cached, the location does not change after construction.
         """
         if not self.location or not self.location.module:
             return None
 
-        if self.location.isFunction:
+        object_type = self.objectType
+        if object_type is Manifest.ObjectType.Function or object_type is Manifest.ObjectType.Method:
             # For function manifests, parent is the class or module manifest
             try:                
-                module = importlib.import_module(self.location.module)
-                if self.location.isMethod:                    
+                module = fast_import(self.location.module)
+                if object_type is Manifest.ObjectType.Method:                    
                     my_class = getattr(module, self.location.classname)
                     return getattr(my_class, "__manifest__", None)                    
                 else:
@@ -422,14 +544,14 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
                 return None
 
         # For class manifests, parent is the module manifest
-        elif self.location.isClass:
+        elif object_type is Manifest.ObjectType.Class:
             try:
-                module = importlib.import_module(self.location.module)
+                module = fast_import(self.location.module)
                 return getattr(module, "__manifest__", None)
             except ImportError:
                 return None
 
-        elif self.location.isModule:               
+        elif object_type is Manifest.ObjectType.Module or object_type is Manifest.ObjectType.Package:
             # Special case for manifest module
             _manifest_module_shortname = ".".join(Manifest.__module__.split(".")[:-1])
             if self.location.shortName == _manifest_module_shortname:
@@ -439,7 +561,7 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
             # For module manifests, parent is the parent module
             # First try to catch __parent_manifest__ in the module
             try:
-                parent = importlib.import_module(self.location.module)
+                parent = fast_import(self.location.module)
                 return getattr(parent, "__parent_manifest__", None)
             except ImportError:
                 pass
@@ -449,7 +571,7 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
             if len(module_parts) > 1:
                 parent_module = ".".join(module_parts[:-1])
                 try:
-                    parent = importlib.import_module(parent_module)
+                    parent = fast_import(parent_module)
                     return getattr(parent, "__manifest__", None)
                 except ImportError:
                     return None
@@ -460,9 +582,9 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
 
     @computed_field
     @property
-    def children(self) -> List["Manifest"]:
+    def children(self) -> Tuple["Manifest", ...]:
         """
-        Return a list of direct child manifests.
+        Return a tuple of direct child manifests.
         
         The manifest hierarchy is defined by parent-child relationships:
         
@@ -495,80 +617,76 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
             └── Function
         """
     
-        childs = []
-        
         if self.isRoot:
-            for module in sys.modules.values():
-                # We only accept top level packages here to be listed under the root manifest
-                if hasattr(module, "__project_manifest__") and not "." in module.__name__:
-                    childs.append(module.__project_manifest__)
-            return childs
+            if _PROJECT_MANIFESTS:
+                return _SORTED_PROJECT_MANIFESTS
+            # Fallback for projects that only set __project_manifest__ without registering it.
+            # Not cached, nothing cheaper than the scan itself tells when sys.modules changed.
+            # We only accept top level packages here to be listed under the root manifest
+            return _sorted_by_fqn(
+                module.__project_manifest__ for module in list(sys.modules.values())
+                if hasattr(module, "__project_manifest__") and not "." in module.__name__
+            )
+
+        # The same sorted tuple is handed out until another child is indexed
+        children = self._children_tuple
+        if children is None:
+            if not self._children_discovered:
+                self._discover_children()
+            # Sorting and storing under the lock, so a child registered meanwhile is not
+            # hidden behind a tuple built from an older snapshot
+            with _REGISTRY_LOCK:
+                children = self._children_tuple
+                if children is None:
+                    children = self._children_tuple = _sorted_by_fqn(self._children)
+        return children
+
+    def _discover_children(self) -> None:
+        """
+        Import the headers below this manifest once, so their manifests register with it.
+
+        Manifests created with an explicit parent are registered on creation. Manifests
+        whose parent is resolved lazily (e.g. the manifest module) are registered when
+        their parent is first resolved, which is triggered here for all members.
+        """
+        object_type = self.objectType
+        if object_type is not Manifest.ObjectType.Package and object_type is not Manifest.ObjectType.Class:
+            # Modules, methods and functions are leaves here, no need to import anything
+            self._children_discovered = True
+            return
 
         try:
             # Only look in the current module, not recursively
-            #print(f"  IMPORTING: {self.location.fqnShort}")
-            #print(f"  IMPORTING: {self.location.module}")
-            module = importlib.import_module(self.location.shortName)
-
-            if self.location.isModule and self.location.isPackage:
-                # We need to find all the __header__ and *_h submodules
-                for finder, name, ispkg in pkgutil.iter_modules(module.__path__):
-                    #print(f"  FINDER: {finder} {name} {ispkg}")
-                    header : str = None
-                    if ispkg:
-                        # its a package, find the __header__ submodule  
-                        header = f"{module.__name__}.{name}.__header__"
-
-                    elif name.endswith("_h"):
-                        header = f"{module.__name__}.{name}"
-
-                    if header:
-                        try:
-                            #print(f"  IMPORTING_HEADER: {header}")
-                            importlib.import_module(header)
-                        except ImportError as e:
-                            #print(f"  IMPORT ERROR: {e}")
-                            pass                    
-
-                #print(f"  MODULE: {self.location.fqnShort}")
-                for name, member in inspect.getmembers(module):
-                    if name.startswith("__") and name.endswith("__"):
-                        continue
-                    #print(f"  NAME: {name} {member}")
-                    if hasattr(member, "__manifest__"):
-                        
-                        #print(f"  MANIFEST: {member.__manifest__}")
-                        #print(f"  PARENT: {member.__manifest__.parent}")
-                        if member.__manifest__.parent == self and not member.__manifest__ in childs:
-                            #print(f"ADD_MOD: {member.__manifest__.location.fqnShort}")
-                            childs.append(member.__manifest__)
+            module = fast_import(self.location.shortName)
+
+            members = []
+            if object_type is Manifest.ObjectType.Package:
+                _import_headers(module)
+
+                # Sorted snapshot, as resolving parents below may import further modules
+                members = sorted(vars(module).items())
             
-            elif self.location.isClass:
-                #print(f"  SELF: {self.location.fqnShort}")
+            elif object_type is Manifest.ObjectType.Class:
                 my_class = getattr(module, self.location.classname)
-                if hasattr(my_class, "__manifest__"):                    
-                    for name, member in inspect.getmembers(my_class):
-                        if name.startswith("__") and name.endswith("__"):
-                            continue
-                        #print(f"  NAME: {name}")
-                        if hasattr(member, "__manifest__"):
-                            #print(f"XNAME: {name}  MANIFEST: {member.__manifest__.location.fqnShort} PARENT: {member.__manifest__.parent.location.fqn}")
-                            if member.__manifest__.parent == self and not member.__manifest__ in childs:
-                                #print(f"ADD_CLASS: {member.__manifest__.location.fqnShort}")
-                                childs.append(member.__manifest__)
-            
-            elif self.location.isFunction:
-                #print(f"  SELF: {self.location.fqnShort} {self.objectType.name.upper()}")
-                # Function dont have childs
-                pass
+                if "__manifest__" in my_class.__dict__:
+                    members = sorted(my_class.__dict__.items())
+
+            for name, member in members:
+                if name.startswith("__") and name.endswith("__"):
+                    continue
+                # Only manifests defined on the member itself count, reading its __dict__ skips
+                # inherited class manifests and custom __getattr__ hooks of arbitrary objects
+                member_dict = getattr(member, "__dict__", None)
+                manifest = member_dict.get("__manifest__") if member_dict is not None else None
+                # Manifests with a known parent registered themselves already, only
+                # resolve the parent (which registers lazily parented manifests) when still open
+                if isinstance(manifest, Manifest) and manifest._parent is None and not manifest._parent_resolved:
+                    manifest.parent
 
         except ImportError as e:
-            print(f"  IMPORT ERROR: {self.location.fqnShort} {e}")
-            pass      
-
-        #print(f"  CHILDREN: {childs}")
+            logger.debug("Import error while discovering children of %s: %s", self.location.fqnShort, e)
 
-        return childs
+        self._children_discovered = True
 
     @computed_field
     @property
@@ -577,34 +695,52 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         Get the project manifest (root manifest for the project).
         It is the module that has __project_manifest__ in its header.
         """
-        mod = self        
-        while mod is not None:
+        if self._project_cache is not _SENTINEL:
+            return self._project_cache
+
+        visited = []
+        project = None
+        resolved = True
+        mod = self
+        # The virtual root manifest belongs to no project. It is matched by identity, as
+        # isRoot is also true for manifests whose parent is attached lazily and not resolved yet
+        while mod is not None and mod is not Manifest.__root_manifest__:
+            # Reuse the project already resolved for an ancestor
+            if mod._project_cache is not _SENTINEL:
+                project = mod._project_cache
+                break
+            visited.append(mod)
             # Check if my own module has __project_manifest__
-            if hasattr(importlib.import_module(mod.location.module), "__project_manifest__"):
-                return mod
-            # If not, check if my parent has __project_manifest__
-            mod = mod.parent
-        return None
+            if hasattr(fast_import(mod.location.module), "__project_manifest__"):
+                project = mod
+                break
+            # If not, check if my parent has __project_manifest__, this resolves lazy parents
+            parent = mod.parent
+            if parent is None and not mod._parent_resolved:
+                # The parent is not attached yet, the project may still be found later on
+                resolved = False
+            mod = parent
+
+        # All manifests on the walked path belong to the same project
+        if resolved:
+            for mod in visited:
+                mod._project_cache = project
+        return project
 
     @computed_field
-    @property
+    @cached_property
     def contributors(self) -> ManifestTypes.ContributorList:
         """Get a list of all contributors from authors, maintainers, and changelog entries."""
-        _contributors = set()  # Using a set to store authors to avoid duplicates
-        if self.authors:
-            for author in self.authors:
-                _contributors.add(author)
-        if self.maintainers:
-            for maintainer in self.maintainers:
-                _contributors.add(maintainer)
-        if self.changelog:
-            for entry in self.changelog:
-                if entry.author:
-                    _contributors.add(entry.author)  # Add author from changelog
-        return Manifest.ContributorList(list(_contributors)) 
+        # Authors hash and compare by their tag, dict.fromkeys keeps the first occurrence in order
+        _contributors = dict.fromkeys(chain(
+            self.authors or (),
+            self.maintainers or (),
+            (entry.author for entry in self.changelog if entry.author),  # Add authors from changelog
+        ))
+        return Manifest.ContributorList(authors=list(_contributors))
 
     @computed_field
-    @property
+    @cached_property
     def version(self) -> Version:
         """Get the current version from the latest changelog entry."""
         if self.changelog and self.changelog[0].version:
@@ -612,7 +748,7 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         raise ValueError("Version not found in changelog")
 
     @computed_field
-    @property
+    @cached_property
     def author(self) -> str:
         """Get the name of the first author if available."""
         if self.authors and len(self.authors) > 0:
@@ -620,7 +756,7 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         return ""
 
     @computed_field
-    @property
+    @cached_property
     def maintainer(self) -> str:
         """Get the name of the first maintainer if available."""
         if self.maintainers and len(self.maintainers) > 0:
@@ -628,7 +764,7 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         return ""
 
     @computed_field
-    @property
+    @cached_property
     def email(self) -> str:
         """Get the email of the first author if available."""
         if self.authors and len(self.authors) > 0 and self.authors[0].email:
@@ -636,13 +772,13 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         return ""
 
     @computed_field
-    @property
+    @cached_property
     def credits(self) -> List[str]:
         """Get a list of all author names."""
-        return [author.name for author in self.authors]
+        return list(map(_GET_NAME, self.authors or ()))
 
     @computed_field
-    @property
+    @cached_property
     def created(self) -> Optional[ManifestTypes.Date]:
         """Get the creation date from the last changelog entry."""
         if self.changelog:
@@ -651,7 +787,7 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         return None
 
     @computed_field
-    @property
+    @cached_property
     def updated(self) -> Optional[ManifestTypes.Date]:
         """Get the last update date from the first changelog entry."""
         if self.changelog:
@@ -660,40 +796,47 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         return None
 
     @computed_field
-    @property
+    @cached_property
     def doc(self) -> str:
         """Get a basic documentation string."""
-        parts = [self.description]
-        if self.version:
+        parts = [self.description] if self.description else []
+        if self.changelog:
             parts.append(f"Version: {self.version}")
         if self.authors:
-            parts.append(f"Authors: {', '.join(author.name for author in self.authors)}")
+            parts.append(f"Authors: {', '.join(map(_GET_NAME, self.authors))}")
         if self.maintainers:
-            parts.append(f"Maintainers: {', '.join(maintainer.name for maintainer in self.maintainers)}")
+            parts.append(f"Maintainers: {', '.join(map(_GET_NAME, self.maintainers))}")
         if self.license:
             parts.append(f"License: {self.license.name}")
         # Could add more details like dependencies, copyright, etc.
-        return ". ".join(filter(None, parts)) + "."
+        return ". ".join(parts) + "."
 
 
     def __str__(self):
-        return f"{self.location.fqn} (v{self.version if self.changelog else 'N/A'})"
+        return self._str_cache
 
 
     def __repr__(self):
         # Provides a more detailed representation, could be made even more exhaustive
-        return f"Manifest({self.location.fqn}, version='{self.version if self.changelog else 'N/A'}', authors={len(self.authors) if self.authors else 0})"
+        return self._repr_cache
 
 
     def __hash__(self):
         # Hash based on a few key identifying attributes
         # Note: Manifest is mutable, so hashing can be tricky if based on mutable fields.
         # Using location fqn as a primary key for the hash.
-        return hash((self.location.fqn, str(self.version if self.changelog else None)))
+        return self._fqn_hash
 
 
     def __eq__(self, other: Any) -> bool:
         #print(f"  TYPE: {type(self)} == {type(other)}")
+
+        # Same object, e.g. when comparing a child's parent with the parent itself
+        if self is other:
+            return True
+
+        if not isinstance(other, Manifest):
+            return False
         
         # If one is root manifest, the other must be too
         if self.isRoot != other.isRoot:
@@ -703,18 +846,14 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         if self.isRoot:
             return True 
 
-        # For normal manifests
-        if not isinstance(other, Manifest):
-            return False
-
         #print(f"  LOC: {self.location} == {other.location}")
 
         # Both must have a location
-        if self.location is None or other.location is None:
+        if self._fqn is None or other._fqn is None:
             return False
 
         return (
-            self.location.fqn == other.location.fqn and
+            self._fqn == other._fqn and
             (self.version if self.changelog else None) == (other.version if other.changelog else None) and 
             self.description == other.description
         )
@@ -723,25 +862,25 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
     def __lt__(self, other: Any) -> bool:
         if not isinstance(other, Manifest):
             return NotImplemented
-        return (self.location.fqn, self.version if self.changelog else Version("0")) < (other.location.fqn, other.version if other.changelog else Version("0"))
+        return self._cmp_key < other._cmp_key
 
 
     def __le__(self, other: Any) -> bool:
         if not isinstance(other, Manifest):
             return NotImplemented
-        return (self.location.fqn, self.version if self.changelog else Version("0")) <= (other.location.fqn, other.version if other.changelog else Version("0"))
+        return self._cmp_key <= other._cmp_key
 
 
     def __gt__(self, other: Any) -> bool:
         if not isinstance(other, Manifest):
             return NotImplemented
-        return (self.location.fqn, self.version if self.changelog else Version("0")) > (other.location.fqn, other.version if other.changelog else Version("0"))
+        return self._cmp_key > other._cmp_key
 
 
     def __ge__(self, other: Any) -> bool:
         if not isinstance(other, Manifest):
             return NotImplemented
-        return (self.location.fqn, self.version if self.changelog else Version("0")) >= (other.location.fqn, other.version if other.changelog else Version("0"))
+        return self._cmp_key >= other._cmp_key
 
 
     def _get_dependencies_recursive(self, recursive: bool = True, type_filter: str = None, category_filter: str = None) -> Dict[str, List[ManifestTypes.Dependency]]:
@@ -749,37 +888,37 @@ class Manifest(ManifestTypes.XObject, ManifestTypes):
         Get the dependencies of the given object path
         """
 
-        dependencies = {}
+        # Case insensitive comparison for both filters, normalize them once for the whole walk
+        type_filter = type_filter.upper() if type_filter is not None else None
+        category_filter = category_filter.upper() if category_filter is not None else None
 
-        if recursive:
-            for child in self.children:
-                dependencies.update(child._get_dependencies_recursive(recursive, type_filter, category_filter))
-
-        # Add self to the dependencies if we have elements
-        if len(self.dependencies) > 0:
-            # Root manifest is purely virtual, so it has no location
-            if self.isRoot:
-                dependencies.update({"/": self.dependencies})
-            else:
-                dependencies.update({self.location.fqnShort: self.dependencies})
-
-        # Filter dependencies based on type and category
-        filtered_dependencies = {}
-        for module, deps in dependencies.items():
+        # Iterative post-order walk into a single dict, children are listed before their parent
+        dependencies = {}
+        stack = [(self, False)]
+        while stack:
+            manifest, expanded = stack.pop()
+            if recursive and not expanded:
+                stack.append((manifest, True))
+                stack.extend((child, False) for child in reversed(manifest.children))
+                continue
+
+            if not manifest.dependencies:
+                continue
+
+            # Filter dependencies based on type and category, each dependency is only tested once
             filtered_deps = []
-            for dep in deps:
-                # Case insensitive comparison for both filters
-                dep_type = dep.type.name.upper()
-                dep_category = getattr(dep, 'category', None) and getattr(dep, 'category').name.upper()
-                type_match = type_filter is None or dep_type == type_filter.upper()
-                category_match = category_filter is None or (dep_category and dep_category == category_filter.upper())
-                
-                if type_match and category_match:
-                    filtered_deps.append(dep)
+            for dep in manifest.dependencies:
+                if type_filter is not None and dep._type_upper != type_filter:
+                    continue
+                if category_filter is not None and dep._category_upper != category_filter:
+                    continue
+                filtered_deps.append(dep)
+
             if filtered_deps:
-                filtered_dependencies[module] = filtered_deps
+                # Root manifest is purely virtual, so it has no location
+                dependencies["/" if manifest.isRoot else manifest.location.fqnShort] = filtered_deps
 
-        return filtered_dependencies
+        return dependencies
 
 
     def listDependencies(self, recursive: bool = True, type_filter: str = None, category_filter: str = None) -> ManifestTypes.Dependency.List:
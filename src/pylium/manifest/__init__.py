@@ -5,5 +5,3 @@ Manifest system for pylium.
 from .__header__ import __manifest__, __root_manifest__, Manifest, tree, deps
 
 __all__ = ["__manifest__", "__root_manifest__", "Manifest", "tree", "deps"]
-
-#print(f"__manifest__@pylium/manifest/__init__.py: {__manifest__}")
@@ -1,44 +1,49 @@
 from .__impl__ import Manifest
-from typing import Dict
 
 
-def _show_recursive_manifest(manifest: Manifest, simple: bool = False, indent_size = 0, level: int = 0, has_more_siblings: Dict[int, bool] = None):
-    if has_more_siblings is None:
-        has_more_siblings = {}
-
-    name = "/" if manifest.location is None else manifest.location.fqnShort
-
-    if simple:
-        if name != "/":
-            print(f"{' ' * indent_size * level}{name}")
-    else:
-        if level == 0:
-            print(f"📦 {name}")
+# Tree drawing characters
+_PREFIX_BRANCH = "├── "
+_PREFIX_LAST = "└── "
+_PREFIX_PIPE = "│   "
+_PREFIX_SPACE = "    "
+
+_TYPE_EMOJI = {
+    Manifest.ObjectType.Package: "📦",
+    Manifest.ObjectType.Module: "📄",
+    Manifest.ObjectType.Class: "❰❱",
+    Manifest.ObjectType.Function: "🔹",
+    Manifest.ObjectType.Method: "🔸"
+}
+
+def _show_recursive_manifest(manifest: Manifest, simple: bool = False, indent_size = 0, level: int = 0, has_more_siblings: int = 0):
+    # Walk the tree depth first with an explicit stack, bit n of the mask tells
+    # whether the node on level n has more siblings below it
+    stack = [(manifest, level, has_more_siblings)]
+    while stack:
+        manifest, level, has_more_siblings = stack.pop()
+
+        name = "/" if manifest.location is None else manifest.location.fqnShort
+
+        if simple:
+            if name != "/":
+                print(f"{' ' * indent_size * level}{name}")
         else:
-            prefix_parts = []
-            for l in range(level):
-                if l == level - 1:
-                    connector = "├── " if has_more_siblings.get(level, False) else "└── "
-                    prefix_parts.append(connector)
-                else:
-                    prefix_parts.append("│   " if has_more_siblings.get(l + 1, False) else "    ")
-
-            type_emoji = {
-                Manifest.ObjectType.Package: "📦",
-                Manifest.ObjectType.Module: "📄",
-                Manifest.ObjectType.Class: "❰❱",
-                Manifest.ObjectType.Function: "🔹",
-                Manifest.ObjectType.Method: "🔸"
-            }.get(manifest.objectType, "•")
-
-            print("".join(prefix_parts) + f"{type_emoji} {name}")
-
-    children = manifest.children
-    for i, child in enumerate(children):
-        has_more = i < len(children) - 1
-        next_siblings = has_more_siblings.copy()
-        next_siblings[level + 1] = has_more
-        _show_recursive_manifest(child, simple, indent_size, level + 1, next_siblings)
+            if level == 0:
+                print(f"📦 {name}")
+            else:
+                prefix_parts = [_PREFIX_PIPE if has_more_siblings & (1 << l) else _PREFIX_SPACE for l in range(1, level)]
+                prefix_parts.append(_PREFIX_BRANCH if has_more_siblings & (1 << level) else _PREFIX_LAST)
+
+                type_emoji = _TYPE_EMOJI.get(manifest.objectType, "•")
+
+                print("".join(prefix_parts) + f"{type_emoji} {name}")
+
+        children = manifest.children
+        last = len(children) - 1
+        bit = 1 << (level + 1)
+        # Push in reverse, so children are shown in order
+        for i in range(last, -1, -1):
+            stack.append((children[i], level + 1, has_more_siblings | bit if i < last else has_more_siblings & ~bit))
 
 
 def cli_tree(manifest: Manifest, simple: bool = False, indent: int = 0):
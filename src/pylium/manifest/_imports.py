@@ -0,0 +1,14 @@
+"""
+Import helpers shared by the manifest implementation and its types.
+"""
+
+# Standard library imports
+from types import ModuleType
+import importlib
+import sys
+
+
+def fast_import(name: str) -> ModuleType:
+    """Import a module, skipping the import machinery if it is already loaded."""
+    module = sys.modules.get(name)
+    return module if module is not None else importlib.import_module(name)
@@ -2,26 +2,11 @@
 Access mode type for the manifest.
 """
 
-# Standard library imports
-from enum import Enum
-from typing import Any
+# Pylium imports
+from .strenum import ManifestStrEnum
 
 
-class ManifestAccessMode(str, Enum):
+class ManifestAccessMode(ManifestStrEnum):
     Sync = "sync"
     Async = "async"
     Hybrid = "hybrid"
-
-    def __str__(self):
-        return self.value
-    
-    def __repr__(self):
-        return self.value
-
-    def __hash__(self) -> int:
-        return hash(self.value)
-    
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, ManifestAccessMode):
-            return False
-        return self.value == other.value
\ No newline at end of file
@@ -3,7 +3,7 @@ Author type for the manifest.
 """
 
 # Pylium imports
-from .value import ManifestValue
+from .value import ManifestValue, ManifestTagIndex
 from .version import ManifestVersion
 
 # Built-in imports
@@ -34,6 +34,8 @@ class ManifestAuthor(ManifestValue):
         )
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ManifestAuthor):
             return False
         return self.tag == other.tag
@@ -48,8 +50,9 @@ class ManifestAuthor(ManifestValue):
         return f"{self.name} ({self.email}) {self.company} [since: {self.since_version} @ {self.since_date}]"
 
 
-class ManifestAuthorList(ManifestValue):
+class ManifestAuthorList(ManifestTagIndex, ManifestValue):
     """List of authors with attribute-based access."""
+    _tag_field = "authors"
     authors: List[ManifestAuthor] = Field(default_factory=list, description="List of authors")
 
     @classmethod
@@ -57,11 +60,11 @@ class ManifestAuthorList(ManifestValue):
         """Create a new author list from a sequence of authors."""
         return cls(authors=list(authors))
 
-    def __getattr__(self, tag: str) -> ManifestAuthor:        
-        for author in self.authors:
-            if author.tag == tag:
-                return author
-        raise AttributeError(f"Author {tag} not found")
+    def __getattr__(self, tag: str) -> ManifestAuthor:
+        author = self._lookup(tag)
+        if author is None:
+            raise AttributeError(f"Author {tag} not found")
+        return author
 
     def __getitem__(self, index: int) -> ManifestAuthor:
         return self.authors[index]
@@ -3,38 +3,24 @@ Types for the manifest.
 """
 
 # Pylium imports
+from .strenum import ManifestStrEnum
 from .xobject import XObject
 from .value import ManifestValue
 from .version import ManifestVersion, ManifestVersionDirection
 
 # Standard library imports
 from typing import Any, Optional, Dict, List
-from enum import Enum
 
 # External imports
 from pydantic import computed_field, Field, ConfigDict
 
 
-class ManifestDependencyType(str, Enum):
+class ManifestDependencyType(ManifestStrEnum):
     PYLIUM = "pylium"
     PIP = "pip"
 
-    def __str__(self):
-        return self.value
-    
-    def __repr__(self):
-        return self.value
-    
-    def __hash__(self) -> int:
-        return hash(self.value)
-    
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, ManifestDependencyType):
-            return False
-        return self.value == other.value
-
 
-class ManifestDependencyCategory(str, Enum):
+class ManifestDependencyCategory(ManifestStrEnum):
     """
     Priority/Criticality level for dependencies.
     Critical dependencies are required for basic functionality.
@@ -43,31 +29,20 @@ class ManifestDependencyCategory(str, Enum):
     RUNTIME = "runtime"
     AUTOMATIC = "automatic"
     DEVELOPMENT = "development"
-    
-    def __str__(self):
-        return self.value
-    
-    def __repr__(self):
-        return self.value
-    
-    def __hash__(self) -> int:
-        return hash(self.value)
-    
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, ManifestDependencyCategory):
-            return False
-        return self.value == other.value
-        
+
     @computed_field
     @property
     def description(self) -> str:
         """Get the description of the dependency category."""
-        return {
-            ManifestDependencyCategory.BUILD: "Required for building the package",
-            ManifestDependencyCategory.RUNTIME: "Required for running the package (minimal set)",
-            ManifestDependencyCategory.AUTOMATIC: "Will be added automatically by the system if required",
-            ManifestDependencyCategory.DEVELOPMENT: "Only needed for development/testing (optional)"
-        }[self]
+        return _category_desc_map[self]
+
+
+_category_desc_map = {
+    ManifestDependencyCategory.BUILD: "Required for building the package",
+    ManifestDependencyCategory.RUNTIME: "Required for running the package (minimal set)",
+    ManifestDependencyCategory.AUTOMATIC: "Will be added automatically by the system if required",
+    ManifestDependencyCategory.DEVELOPMENT: "Only needed for development/testing (optional)"
+}
 
 
 class ManifestDependencyConflict(ManifestValue):
@@ -124,6 +99,14 @@ class ManifestDependency(ManifestValue, ManifestDependencyTypes):
         description="Category of the dependency"
     )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Upper case names used by the case insensitive dependency filters
+        self.__dict__.update(
+            _type_upper=self.type.name.upper(),
+            _category_upper=self.category.name.upper() if self.category else None,
+        )
+
     def __str__(self) -> str:
         """Return a string representation of the dependency."""
         parts = [
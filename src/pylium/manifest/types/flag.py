@@ -0,0 +1,91 @@
+"""
+Flag base type for the manifest.
+"""
+
+# Standard library imports
+from enum import Flag
+from typing import Any
+
+
+class ManifestFlag(Flag):
+    """
+    Base for manifest flags, formatting members as lower case names.
+
+    Flag members, including combinations, are singletons, so str and repr are
+    built once per member and cached on it. Subclasses call _finalize() after
+    their definition, formatting then uses precomputed tables instead of
+    iterating the flag class.
+    """
+
+    @classmethod
+    def _finalize(cls) -> None:
+        """Set up a flag subclass once its members exist."""
+        # EnumType copies Flag.__or__ into every flag class that does not define
+        # it in its own body, which would hide the fast path below
+        cls.__or__ = ManifestFlag.__or__
+
+        # Single bit members in value order and the name of the zero member
+        cls._single_bits = tuple(sorted(
+            (member.value, member.name) for member in cls.__members__.values()
+            if member.value and member.value & (member.value - 1) == 0
+        ))
+        cls._zero_name = next((member.name for member in cls.__members__.values() if member.value == 0), None)
+
+    def _format_str(self) -> str:
+        # If the flag instance has a specific name (it's a single defined flag or a named combination like 'All')
+        if self.name is not None:
+            return self.name.lower()
+
+        # It's an unnamed combination (e.g., CLI | API) or a value like 0 if not directly named.
+        names = [name for value, name in self._single_bits if self._value_ & value]
+        if not names:
+            # This implies self.value is 0.
+            if self._value_ == 0:
+                zero_name = self._zero_name
+                return zero_name.lower() if zero_name is not None else "0" # e.g., "nofrontend"
+            return str(self.value)
+
+        return " | ".join(name.lower() for name in names)
+
+    def _format_repr(self) -> str:
+        cls_name = self.__class__.__name__
+        names = [name for value, name in self._single_bits if self._value_ & value]
+
+        if not names:
+            if self._value_ == 0:
+                zero_name = self._zero_name
+                return f"{cls_name}.{zero_name}" if zero_name is not None else f"<{cls_name}: 0>"
+            return f"<{cls_name} value: {self.value}>"
+
+        return " | ".join(f"{cls_name}.{name}" for name in names)
+
+    def __str__(self):
+        cached = self.__dict__.get("_cached_str")
+        if cached is None:
+            cached = self.__dict__["_cached_str"] = self._format_str()
+        return cached
+
+    def __repr__(self):
+        cached = self.__dict__.get("_cached_repr")
+        if cached is None:
+            cached = self.__dict__["_cached_repr"] = self._format_repr()
+        return cached
+
+    def __or__(self, other):
+        # Combinations are interned in _value2member_map_ once created, skip the enum call machinery
+        if type(other) is type(self):
+            member = self._value2member_map_.get(self._value_ | other._value_)
+            if member is not None:
+                return member
+        return Flag.__or__(self, other)
+
+    def __hash__(self) -> int:
+        return hash(self._value_)
+
+    def __eq__(self, other: Any) -> bool:
+        # Members are singletons, and flag classes with members cannot be subclassed
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return False
+        return self._value_ == other._value_
@@ -3,7 +3,7 @@ License type for the manifest.
 """
 
 # Pylium imports
-from .value import ManifestValue
+from .value import ManifestValue, ManifestTagIndex
 from .author import ManifestAuthor
 
 # Standard library imports
@@ -37,6 +37,8 @@ class ManifestLicense(ManifestValue):
     url: Optional[str] = None
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ManifestLicense):
             return False
         return self.tag == other.tag
@@ -51,15 +53,21 @@ class ManifestLicense(ManifestValue):
         return f"{self.tag} ({self.spdx}) {self.name} [{self.url}]"
     
 
-class ManifestLicenseList(ManifestValue):
+class ManifestLicenseList(ManifestTagIndex, ManifestValue):
     """List of licenses with attribute-based access."""
+    _tag_field = "licenses"
     licenses: List[ManifestLicense]
 
-    def __getattr__(self, tag: str) -> ManifestLicense:        
-        for license in self.licenses:
-            if license.tag == tag:
-                return license
-        raise AttributeError(f"License {tag} not found")
+    def get(self, tag: str, default: Optional[ManifestLicense] = None) -> Optional[ManifestLicense]:
+        """Get a license by its tag, without going through attribute lookup."""
+        license = self._lookup(tag)
+        return default if license is None else license
+
+    def __getattr__(self, tag: str) -> ManifestLicense:
+        license = self._lookup(tag)
+        if license is None:
+            raise AttributeError(f"License {tag} not found")
+        return license
 
     def __str__(self):
         return f"{self.licenses}"
@@ -4,16 +4,36 @@ Location type for the manifest.
 
 # Pylium imports
 from .value import ManifestValue
+from .._imports import fast_import
 
 # Built-in imports
 from typing import Optional
+from functools import cached_property, lru_cache
 import importlib
+import importlib.util
 import inspect
+import sys
 from pathlib import Path
 
 # External imports
 from pydantic import Field, computed_field
 
+def _find_spec(module: str):
+    """Find the spec of a module, taking it from sys.modules when the module is already imported."""
+    spec = getattr(sys.modules.get(module), "__spec__", None)
+    if spec is None:
+        spec = importlib.util.find_spec(module)
+    return spec
+
+@lru_cache(maxsize=None)
+def _resolve_module_file(module: str) -> str:
+    """Resolve the file of a module, cached as many manifests share the same module."""
+    spec = _find_spec(module)
+    if spec is None or spec.origin is None:
+        raise ImportError(f"Could not find module {module}")
+    return str(Path(spec.origin).resolve())
+
+
 class ManifestLocation(ManifestValue):
     """A location in the manifest system, identifying a module, class, or function."""
     module: str = Field(..., description="The module name")
@@ -29,46 +49,45 @@ class ManifestLocation(ManifestValue):
         return module_name
 
     @computed_field
-    @property
+    @cached_property
     def file(self) -> str:
         """The file location from the module name."""
-        spec = importlib.util.find_spec(self.module)
-        if spec is None or spec.origin is None:
-            raise ImportError(f"Could not find module {self.module}")
-        return str(Path(spec.origin).resolve())
+        return _resolve_module_file(self.module)
 
     @computed_field
-    @property
+    @cached_property
     def shortName(self) -> str:
         """Returns the module name with implementation suffixes removed."""
         return self._get_short_name(self.module)
 
     @computed_field
-    @property
+    @cached_property
     def fqn(self) -> str:
-        """Fully qualified name."""
+        """Fully qualified name, interned as it keys the manifest hash and comparisons."""
         if self.funcname and self.classname:
-            return f"{self.module}.{self.classname}.{self.funcname}"
+            fqn = f"{self.module}.{self.classname}.{self.funcname}"
         elif self.classname:
-            return f"{self.module}.{self.classname}"
+            fqn = f"{self.module}.{self.classname}"
         elif self.funcname:
-            return f"{self.module}.{self.funcname}"
+            fqn = f"{self.module}.{self.funcname}"
         else:
-            return self.module
+            fqn = self.module
+        return sys.intern(fqn)
 
     @computed_field
-    @property
+    @cached_property
     def fqnShort(self) -> str:
-        """Short fully qualified name."""
+        """Short fully qualified name, interned as it keys manifest lookups."""
         short_name = self.shortName
         if self.funcname and self.classname:
-            return f"{short_name}.{self.classname}.{self.funcname}"
+            fqn_short = f"{short_name}.{self.classname}.{self.funcname}"
         elif self.classname:
-            return f"{short_name}.{self.classname}"
+            fqn_short = f"{short_name}.{self.classname}"
         elif self.funcname:
-            return f"{short_name}.{self.funcname}"
+            fqn_short = f"{short_name}.{self.funcname}"
         else:
-            return short_name
+            fqn_short = short_name
+        return sys.intern(fqn_short)
 
     @computed_field
     @property
@@ -94,11 +113,13 @@ class ManifestLocation(ManifestValue):
         return f"{self.fqn} @ {self.file}"
 
     @computed_field
-    @property
+    @cached_property
     def isPackage(self) -> bool:
-        """Checks if the location points to a package (and not a single .py file)"""
-        spec = importlib.util.find_spec(self.shortName)
-        return self.isModule and spec is not None and spec.submodule_search_locations is not None and len(spec.submodule_search_locations) > 0
+        """Checks if the location points to a package (and not a single .py file), cached as the spec does not change."""
+        if not self.isModule:
+            return False
+        spec = _find_spec(self.shortName)
+        return spec is not None and spec.submodule_search_locations is not None and len(spec.submodule_search_locations) > 0
     
     @computed_field
     @property
@@ -130,7 +151,7 @@ class ManifestLocation(ManifestValue):
         """Checks if the location points to a @classmethod."""
         if not (self.classname and self.funcname):
             return False
-        mod = importlib.import_module(self.module)
+        mod = fast_import(self.module)
         cls = getattr(mod, self.classname, None)
         if cls is None:
             return False
@@ -143,7 +164,7 @@ class ManifestLocation(ManifestValue):
         """Checks if the location points to a @staticmethod."""
         if not (self.classname and self.funcname):
             return False
-        mod = importlib.import_module(self.module)
+        mod = fast_import(self.module)
         cls = getattr(mod, self.classname, None)
         if cls is None:
             return False
@@ -2,15 +2,17 @@
 Object type for the manifest.
 """
 
+# Pylium imports
+from .strenum import ManifestStrEnum
+
 # Standard library imports
-from enum import Enum
-from typing import Any, Set
+from typing import FrozenSet
 
 # External imports
 from pydantic import computed_field
 
 
-class ManifestObjectType(str, Enum):
+class ManifestObjectType(ManifestStrEnum):
     """
     The type of object that the manifest is describing.
     """
@@ -21,29 +23,14 @@ class ManifestObjectType(str, Enum):
     Method = "method"
     Function = "function"
 
-    def __str__(self):
-        return self.value
-    
-    def __repr__(self):
-        return self.value
-    
-    def __hash__(self) -> int:
-        return hash(self.value)
-    
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, ManifestObjectType):
-            return False
-        return self.value == other.value
-    
     def canContain(self, other: "ManifestObjectType") -> bool:
         """Check if this object type can contain another object type."""
-        if ManifestObjectType._containment_matrix is None:
-            raise RuntimeError("ManifestObjectType._containment_matrix is not initialized")
-        if self not in ManifestObjectType._containment_matrix:
+        bits = ManifestObjectType._containment_bits[self._ordinal]
+        if bits is None:
             raise RuntimeError(f"ManifestObjectType {self} is not in the containment matrix")
-        if other not in ManifestObjectType._containment_matrix[self]:
+        if type(other) is not ManifestObjectType:
             return False
-        return True
+        return bool(bits >> other._ordinal & 1)
     
     def canBeContainedIn(self, other: "ManifestObjectType") -> bool:
         """Check if this object type can be contained in another object type."""
@@ -51,14 +38,9 @@ class ManifestObjectType(str, Enum):
     
     @computed_field
     @property
-    def possibleChildren(self) -> Set["ManifestObjectType"]:
+    def possibleChildren(self) -> FrozenSet["ManifestObjectType"]:
         """Get the set of object types that can be children of this type."""
-        if ManifestObjectType._containment_matrix is None:
-            raise RuntimeError("ManifestObjectType._containment_matrix is not initialized")
-        if self not in ManifestObjectType._containment_matrix:
-            return Set[ManifestObjectType]()
-        return ManifestObjectType._containment_matrix[self]
-
+        return ManifestObjectType._children_cache[self._ordinal]
 
 ManifestObjectType._containment_matrix = {
     ManifestObjectType.Package: {ManifestObjectType.Package, ManifestObjectType.Module, ManifestObjectType.Class, ManifestObjectType.Function},
@@ -66,4 +48,22 @@ ManifestObjectType._containment_matrix = {
     ManifestObjectType.Class: {ManifestObjectType.Method},
     ManifestObjectType.Method: {},
     ManifestObjectType.Function: {}
-}
\ No newline at end of file
+}
+
+
+# Containment as one bitmask per type, indexed by ordinal, bit n set if type n can be contained
+for _ordinal, _member in enumerate(ManifestObjectType):
+    _member._ordinal = _ordinal
+
+ManifestObjectType._containment_bits = tuple(
+    sum(1 << child._ordinal for child in ManifestObjectType._containment_matrix[member])
+    if member in ManifestObjectType._containment_matrix else None
+    for member in ManifestObjectType
+)
+
+# Frozen child sets indexed by ordinal, types missing in the matrix can contain nothing
+_EMPTY = frozenset()
+ManifestObjectType._children_cache = tuple(
+    frozenset(ManifestObjectType._containment_matrix.get(member, _EMPTY))
+    for member in ManifestObjectType
+)
@@ -0,0 +1,19 @@
+"""
+String enum base type for the manifest.
+"""
+
+# Standard library imports
+from enum import Enum
+
+
+class ManifestStrEnum(str, Enum):
+    """
+    Base for manifest enums whose members print as their plain value.
+
+    The members are str instances holding their value, so str, repr and format
+    use the C implementations of str directly instead of going through the
+    Python level Enum.value property on every call.
+    """
+    __str__ = str.__str__
+    __repr__ = str.__str__
+    __format__ = str.__format__
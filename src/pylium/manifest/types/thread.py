@@ -4,7 +4,7 @@ Thread safety type for the manifest.
 
 # Standard library imports
 from enum import Enum
-from typing import Any
+import sys
 
 # External imports
 from pydantic import computed_field
@@ -17,27 +17,26 @@ class ManifestThreadSafety(str, Enum):
     Immutable  = "immutable"
 
     def __str__(self):
-        return f"{self.name.lower()}"
+        return self._cached_str
 
     def __repr__(self):
-        return f"{self.name.lower()}"
-
-    def __hash__(self) -> int:
-        return hash(self.value)
-    
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, ManifestThreadSafety):
-            return False
-        return self.value == other.value
-    
+        return self._cached_str
+
     @computed_field
     @property
     def description(self) -> str:
         """Get the description of the thread safety level."""
-        return {
-            ManifestThreadSafety.Unsafe: "No synchronization, may cause race conditions.",
-            ManifestThreadSafety.Reentrant: "Reentrant for single thread recursion, not parallel-safe.",
-            ManifestThreadSafety.ThreadSafe: "Internally synchronized for parallel access.",
-            ManifestThreadSafety.ActorSafe: "Thread-safe via actor/queue-based serialized access.",
-            ManifestThreadSafety.Immutable: "Immutable after creation, safe by design."
-        }[self]
\ No newline at end of file
+        return _desc_map[self]
+
+
+# The lower case names are fixed per member, format and intern them once
+for _member in ManifestThreadSafety:
+    _member._cached_str = sys.intern(_member.name.lower())
+
+_desc_map = {
+    ManifestThreadSafety.Unsafe: "No synchronization, may cause race conditions.",
+    ManifestThreadSafety.Reentrant: "Reentrant for single thread recursion, not parallel-safe.",
+    ManifestThreadSafety.ThreadSafe: "Internally synchronized for parallel access.",
+    ManifestThreadSafety.ActorSafe: "Thread-safe via actor/queue-based serialized access.",
+    ManifestThreadSafety.Immutable: "Immutable after creation, safe by design."
+}
\ No newline at end of file
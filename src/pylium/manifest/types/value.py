@@ -6,6 +6,7 @@ Base value type for the manifest system.
 from .xobject import XObject
 
 # Standard library imports
+from typing import Any, ClassVar, Dict, Optional
 import datetime
 
 class ManifestValueTypes:
@@ -19,3 +20,30 @@ class ManifestValue(XObject, ManifestValueTypes):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+
+
+class ManifestTagIndex:
+    """Tag lookup for manifest value lists, the list field is named by _tag_field."""
+    _tag_field: ClassVar[str] = ""
+
+    def _index(self, rebuild: bool = False) -> Dict[str, Any]:
+        """Index the items by tag, the first item with a tag wins."""
+        # The index remembers its list, so it is rebuilt if the list gets replaced
+        items = self.__dict__.get(self._tag_field)
+        if items is None:
+            return {}
+        indexed, by_tag = self.__dict__.get("_by_tag", (None, None))
+        if rebuild or indexed is not items:
+            by_tag = {}
+            for item in items:
+                by_tag.setdefault(item.tag, item)
+            self.__dict__["_by_tag"] = (items, by_tag)
+        return by_tag
+
+    def _lookup(self, tag: str) -> Optional[Any]:
+        """Look up an item by its tag, None if there is none."""
+        item = self._index().get(tag)
+        if item is None:
+            # The list may have been changed in place since the index was built
+            item = self._index(rebuild=True).get(tag)
+        return item
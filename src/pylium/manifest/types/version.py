@@ -2,9 +2,11 @@
 Version type for the manifest.
 """
 
+# Pylium imports
+from .strenum import ManifestStrEnum
+
 # Standard imports
 from typing import Any, Annotated
-from enum import Enum
 import re
 
 # External imports
@@ -13,7 +15,7 @@ from pydantic import Field, GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
 
-class ManifestVersionDirection(str, Enum):
+class ManifestVersionDirection(ManifestStrEnum):
     """
     The direction of the version.
     """
@@ -22,28 +24,14 @@ class ManifestVersionDirection(str, Enum):
     MINIMUM = "minimum"
     EXACT = "exact"
     MAXIMUM = "maximum"
-    
-    def __str__(self):
-        return self.value
-    
-    def __repr__(self):
-        return self.value
-    
-    def __hash__(self) -> int:
-        return hash(self.value)
-    
-    def __eq__(self, other: Any) -> bool:
-        if not isinstance(other, ManifestVersionDirection):
-            return False
-        return self.value == other.value
-       
+
     @property
     def description(self) -> str:
-        return _desc_map[self]
+        return self._description
     
     @property
     def sign(self) -> str:
-        return _sign_map[self]
+        return self._sign
 
     @classmethod
     def from_sign(cls, sign: str) -> "ManifestVersionDirection":
@@ -64,6 +52,11 @@ _desc_map = {
 }
 _sign_to_direction = {v: k for k, v in _sign_map.items()}
 
+# Store sign and description on the members, so the properties are plain attribute reads
+for _direction in ManifestVersionDirection:
+    _direction._sign = _sign_map[_direction]
+    _direction._description = _desc_map[_direction]
+
 
 class ManifestVersionTypes():
     """Types for the version."""
@@ -82,7 +75,8 @@ class ManifestVersion(str, ManifestVersionTypes):
                 if sign and direction == ManifestVersionDirection.NONE:
                     direction = ManifestVersionDirection.from_sign(sign)
                 version = ver
-            version = PackagingVersion(version)
+            # Parse once, comparisons and the version property use the parsed object
+            ver = version = PackagingVersion(version)
         elif isinstance(version, PackagingVersion):
             ver = version
             version = str(version)
@@ -0,0 +1,75 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to sys.path, like the other tests in tests/core
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from pylium.manifest import Manifest
+
+
+# Top of a tree that is not listed under the root manifest, the manifests below only exist for these tests
+_top = Manifest(
+    parent=None,
+    location=Manifest.Location(module=__name__),
+    description="Top for property tests",
+)
+
+_alice = Manifest.Author(tag="alice", name="Alice")
+_bob = Manifest.Author(tag="bob", name="Bob")
+_carol = Manifest.Author(tag="carol", name="Carol")
+
+
+def _manifest(classname: str, **kwargs) -> Manifest:
+    return Manifest(parent=_top, location=Manifest.Location(module=__name__, classname=classname), **kwargs)
+
+
+class TestManifestContributors(unittest.TestCase):
+
+    def test_contributors(self):
+        # Authors, maintainers and changelog authors, each once in first-seen order
+        manifest = _manifest(
+            "Contributors",
+            authors=Manifest.AuthorList(authors=[_alice, _bob]),
+            maintainers=Manifest.MaintainerList(authors=[_bob, _carol]),
+            changelog=[
+                Manifest.Changelog(version="0.2.0", date=Manifest.Date(2025, 2, 1), author=_carol),
+                Manifest.Changelog(version="0.1.0", date=Manifest.Date(2025, 1, 1), author=_alice),
+            ],
+        )
+        self.assertEqual([author.tag for author in manifest.contributors], ["alice", "bob", "carol"])
+
+    def test_no_contributors(self):
+        self.assertEqual(len(_manifest("NoContributors").contributors), 0)
+
+
+class TestManifestDoc(unittest.TestCase):
+
+    def test_doc_without_changelog(self):
+        self.assertEqual(_manifest("DocNoChangelog", description="Just a description").doc, "Just a description.")
+
+    def test_doc(self):
+        manifest = _manifest(
+            "Doc",
+            description="Documented",
+            authors=Manifest.AuthorList(authors=[_alice, _bob]),
+            maintainers=Manifest.MaintainerList(authors=[_carol]),
+            changelog=[Manifest.Changelog(version="1.2.0", date=Manifest.Date(2025, 1, 1))],
+        )
+        self.assertEqual(manifest.doc, "Documented. Version: 1.2.0. Authors: Alice, Bob. Maintainers: Carol.")
+
+
+class TestManifestCredits(unittest.TestCase):
+
+    def test_credits(self):
+        manifest = _manifest("Credits", authors=Manifest.AuthorList(authors=[_alice, _bob]))
+        self.assertEqual(manifest.credits, ["Alice", "Bob"])
+
+    def test_credits_without_authors(self):
+        self.assertEqual(_manifest("CreditsNoAuthors").credits, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
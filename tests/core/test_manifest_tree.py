@@ -0,0 +1,251 @@
+import unittest
+import sys
+import threading
+import types
+from pathlib import Path
+
+# Add project root to sys.path, like the other tests in tests/core
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import pylium
+from pylium.manifest import Manifest, tree
+import pylium.manifest.__impl__ as manifest_impl
+
+
+class TestManifestProject(unittest.TestCase):
+
+    def test_project_through_lazy_parent(self):
+        # The manifest module's manifest gets its parent attached lazily, the walk
+        # has to resolve it instead of stopping there
+        project = tree.__manifest__.project
+        self.assertIs(project, pylium.__project_manifest__)
+        # The cached result stays the project
+        self.assertIs(tree.__manifest__.project, pylium.__project_manifest__)
+
+    def test_root_has_no_project(self):
+        self.assertIsNone(Manifest.__root_manifest__.project)
+
+
+class TestManifestChildren(unittest.TestCase):
+
+    def test_children_sorted_by_fqn(self):
+        for path in ("pylium", "pylium.core", "pylium.core.crowbar", "pylium.manifest"):
+            names = [child.location.fqnShort for child in Manifest.getManifest(path).children]
+            self.assertTrue(names, path)
+            self.assertEqual(names, sorted(names), path)
+
+    def test_child_without_location(self):
+        # A manifest waiting for Manifest.func() to set its location is listed once it has one
+        parent = DetachedParent.__manifest__
+        pending = Manifest(parent=parent, description="Pending function")
+        self.assertNotIn(pending, parent.children)
+
+        def pending_function():
+            pass
+
+        Manifest.func(pending)(pending_function)
+        self.assertEqual([c for c in parent.children if c is pending], [pending])
+        self.assertEqual(
+            [c.location.fqnShort for c in parent.children],
+            sorted(c.location.fqnShort for c in parent.children),
+        )
+
+
+# Top of a tree that is not listed under the root manifest, nothing below it is reachable from the root
+_detached_top = Manifest(
+    parent=None,
+    location=Manifest.Location(module=__name__),
+    description="Detached top for registry tests",
+)
+
+
+class DetachedParent:
+    __manifest__: Manifest = Manifest(
+        parent=_detached_top,
+        location=Manifest.Location(module=__name__, classname="DetachedParent"),
+        description="Detached parent for registry tests",
+    )
+
+    def child(self):
+        pass
+
+    child.__manifest__ = Manifest(
+        parent=__manifest__,
+        location=Manifest.Location(module=__name__, classname="DetachedParent", funcname="child"),
+        description="Registered child",
+    )
+
+
+class TestManifestRegistry(unittest.TestCase):
+
+    def test_child_registers_with_parent(self):
+        parent = DetachedParent.__manifest__
+        child = DetachedParent.child.__manifest__
+        self.assertEqual([c for c in parent.children if c is child], [child])
+        self.assertIs(parent._get_child(child.location.fqnShort), child)
+
+    def test_lookup_by_fqn_matches_tree_walk(self):
+        root = Manifest.__root_manifest__
+        for path in ("pylium", "pylium.core", "pylium.core.crowbar.Crowbar", "pylium.manifest.tree"):
+            found = Manifest.getManifest(path)
+            self.assertIsNotNone(found, path)
+            self.assertIs(found, Manifest.getManifest(path, search_base=root), path)
+
+    def test_unreachable_manifest_not_returned(self):
+        child = DetachedParent.child.__manifest__
+        self.assertIs(Manifest.__fqn_index__.get(child.location.fqnShort), child)
+        self.assertIsNone(Manifest.getManifest(child.location.fqnShort))
+
+    def test_duplicate_fqn(self):
+        real = Manifest.getManifest("pylium.core")
+        try:
+            with self.assertLogs("pylium.manifest", level="WARNING"):
+                duplicate = Manifest(
+                    parent=DetachedParent.__manifest__,
+                    location=Manifest.Location(module="pylium.core.__header__"),
+                    description="Duplicate of pylium.core",
+                )
+            self.assertIs(Manifest.__fqn_index__["pylium.core"], duplicate)
+            # The duplicate is not reachable from the root, the lookup still finds the real one
+            self.assertIs(Manifest.getManifest("pylium.core"), real)
+        finally:
+            Manifest.__fqn_index__["pylium.core"] = real
+
+    def test_concurrent_registration(self):
+        # Children registered while other threads rebuild the sorted view all end up listed
+        parent = DetachedParent.__manifest__
+        created = []
+
+        def register(start):
+            for i in range(start, start + 50):
+                created.append(Manifest(
+                    parent=parent,
+                    location=Manifest.Location(module=__name__, classname="DetachedParent", funcname=f"threaded_{i}"),
+                    description="Threaded child",
+                ))
+                parent.children
+
+        threads = [threading.Thread(target=register, args=(n * 50,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        children = parent.children
+        self.assertEqual(len(created), 400)
+        self.assertTrue(all(any(c is manifest for c in children) for manifest in created))
+
+
+class TestManifestRegisterProject(unittest.TestCase):
+
+    def test_root_lists_registered_project(self):
+        project = pylium.__project_manifest__
+        self.assertEqual([p for p in Manifest.__root_manifest__.children if p is project], [project])
+
+    def test_register_project_is_idempotent(self):
+        project = pylium.__project_manifest__
+        self.assertIs(Manifest.registerProject(project), project)
+        self.assertIs(Manifest.registerProject(project), project)
+        self.assertEqual([p for p in Manifest.__root_manifest__.children if p is project], [project])
+
+    def test_root_skips_scan_when_projects_are_registered(self):
+        # Registered projects are listed without touching the attributes of every loaded module
+        module = types.ModuleType("pylium_lazy_module")
+        touched = []
+        module.__getattr__ = lambda name: touched.append(name)
+        sys.modules[module.__name__] = module
+        try:
+            children = Manifest.__root_manifest__.children
+        finally:
+            del sys.modules[module.__name__]
+        self.assertIn(pylium.__project_manifest__, children)
+        self.assertEqual(touched, [])
+
+    def test_root_scans_when_nothing_is_registered(self):
+        # Projects that only set __project_manifest__ are still found when nothing is registered
+        module = types.ModuleType("pylium_unregistered_project")
+        module.__project_manifest__ = Manifest(
+            parent=Manifest.__root_manifest__,
+            location=Manifest.Location(module=module.__name__),
+            description="Unregistered project",
+        )
+        placeholder = types.ModuleType("pylium_placeholder_module")
+        registered = list(manifest_impl._PROJECT_MANIFESTS)
+        sys.modules[placeholder.__name__] = placeholder
+        try:
+            manifest_impl._PROJECT_MANIFESTS.clear()
+            self.assertNotIn(module.__project_manifest__, Manifest.__root_manifest__.children)
+            # Swapping modules keeps the size of sys.modules, the project still has to show up
+            del sys.modules[placeholder.__name__]
+            sys.modules[module.__name__] = module
+            children = Manifest.__root_manifest__.children
+        finally:
+            manifest_impl._PROJECT_MANIFESTS[:] = registered
+            sys.modules.pop(placeholder.__name__, None)
+            sys.modules.pop(module.__name__, None)
+        self.assertEqual([p for p in children if p is module.__project_manifest__], [module.__project_manifest__])
+        self.assertEqual([p for p in children if p is pylium.__project_manifest__], [pylium.__project_manifest__])
+        self.assertNotIn(module.__project_manifest__, Manifest.__root_manifest__.children)
+
+
+class TestManifestOrdering(unittest.TestCase):
+
+    def test_same_key_different_description(self):
+        # Ordering only looks at fqn and version, the description does not matter
+        a = Manifest(
+            parent=_detached_top,
+            location=Manifest.Location(module=__name__, classname="Ordered"),
+            description="First",
+        )
+        b = Manifest(
+            parent=_detached_top,
+            location=Manifest.Location(module=__name__, classname="Ordered"),
+            description="Second",
+        )
+        self.assertNotEqual(a, b)
+        self.assertFalse(a < b or b < a)
+        self.assertFalse(a > b or b > a)
+        self.assertTrue(a <= b and b <= a)
+        self.assertTrue(a >= b and b >= a)
+
+    def test_sorted_by_parsed_version(self):
+        # The same manifest in two versions sorts by version, not by the version text
+        manifests = [
+            Manifest(
+                parent=_detached_top,
+                location=Manifest.Location(module=__name__, classname="Versioned"),
+                description="Versioned",
+                changelog=[Manifest.Changelog(version=version, date=Manifest.Date(2025, 1, 1))],
+            )
+            for version in ("0.10.0", "0.9.0")
+        ]
+        self.assertEqual([str(m.version) for m in sorted(manifests)], ["0.9.0", "0.10.0"])
+
+
+class TestManifestTagIndex(unittest.TestCase):
+
+    def test_author_appended_in_place(self):
+        authors = Manifest.AuthorList(authors=[Manifest.Author(tag="a", name="A")])
+        self.assertEqual(authors.a.name, "A")
+        authors.authors.append(Manifest.Author(tag="b", name="B"))
+        self.assertEqual(authors.b.name, "B")
+        with self.assertRaises(AttributeError):
+            authors.c
+
+    def test_license_appended_in_place(self):
+        licenses = Manifest.LicenseList(licenses=[Manifest.Licenses.MIT])
+        self.assertIs(licenses.MIT, Manifest.Licenses.MIT)
+        licenses.licenses.append(Manifest.Licenses.Apache2)
+        self.assertIs(licenses.Apache2, Manifest.Licenses.Apache2)
+        with self.assertRaises(AttributeError):
+            licenses.GPL3only
+
+    def test_license_get(self):
+        self.assertIs(Manifest.Licenses.get("MIT"), Manifest.Licenses.MIT)
+        self.assertIsNone(Manifest.Licenses.get("NotALicense"))
+        self.assertIs(Manifest.Licenses.get("NotALicense", Manifest.Licenses.NoLicense), Manifest.Licenses.NoLicense)
+
+
+if __name__ == '__main__':
+    unittest.main()
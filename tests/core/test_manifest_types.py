@@ -0,0 +1,123 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to sys.path, like the other tests in tests/core
+project_root = Path(__file__).resolve().parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from packaging.version import Version
+
+from pylium.manifest import Manifest
+
+
+class TestManifestObjectType(unittest.TestCase):
+
+    def test_can_contain(self):
+        ObjectType = Manifest.ObjectType
+        self.assertTrue(ObjectType.Package.canContain(ObjectType.Module))
+        self.assertTrue(ObjectType.Class.canContain(ObjectType.Method))
+        self.assertFalse(ObjectType.Module.canContain(ObjectType.Package))
+        self.assertTrue(ObjectType.Method.canBeContainedIn(ObjectType.Class))
+
+    def test_can_contain_non_member(self):
+        # Only object types can be contained, not their raw values
+        self.assertFalse(Manifest.ObjectType.Package.canContain("module"))
+        self.assertFalse(Manifest.ObjectType.Package.canContain(None))
+
+    def test_possible_children(self):
+        ObjectType = Manifest.ObjectType
+        self.assertEqual(
+            ObjectType.Package.possibleChildren,
+            frozenset({ObjectType.Package, ObjectType.Module, ObjectType.Class, ObjectType.Function}),
+        )
+        self.assertEqual(ObjectType.Class.possibleChildren, frozenset({ObjectType.Method}))
+        # Empty matrix entries and types missing from the matrix give an empty set
+        self.assertEqual(ObjectType.Method.possibleChildren, frozenset())
+        self.assertEqual(ObjectType.Invalid.possibleChildren, frozenset())
+        for object_type in ObjectType:
+            self.assertIsInstance(object_type.possibleChildren, frozenset, object_type)
+
+
+class TestManifestFlag(unittest.TestCase):
+
+    def test_zero_member(self):
+        # Iterating a flag class skips zero members, the zero value still formats with its name
+        self.assertEqual(repr(Manifest.Frontend.NoFrontend), "ManifestFrontend.NoFrontend")
+        self.assertEqual(str(Manifest.Frontend.NoFrontend), "nofrontend")
+        self.assertEqual(repr(Manifest.BackendGroup.NoBackendGroup), "ManifestBackendGroup.NoBackendGroup")
+        self.assertEqual(repr(Manifest.Frontend(0)), "ManifestFrontend.NoFrontend")
+
+    def test_combination(self):
+        Frontend = Manifest.Frontend
+        self.assertEqual(repr(Frontend.CLI), "ManifestFrontend.CLI")
+        self.assertEqual(str(Frontend.CLI), "cli")
+        self.assertEqual(repr(Frontend.CLI | Frontend.Web), "ManifestFrontend.CLI | ManifestFrontend.Web")
+        self.assertIs(Frontend.CLI | Frontend.Web, Frontend.CLI | Frontend.Web)
+
+
+class TestManifestBackend(unittest.TestCase):
+
+    def test_all_values(self):
+        # Groups and formatting of every backend value, against the mapping spelled out per backend
+        Backend = Manifest.Backend
+        Group = Manifest.BackendGroup
+        groups = {
+            Backend.SQLite: Group.Database,
+            Backend.Redis: Group.Database | Group.Network,
+            Backend.PostgreSQL: Group.Database | Group.Network,
+            Backend.File: Group.File,
+            Backend.MQTT: Group.Network,
+            Backend.Docker: Group.Container | Group.Network,
+        }
+        for value in range(Backend.All.value + 1):
+            backend = Backend(value)
+            group = Group.NoBackendGroup
+            names = []
+            for single, single_group in groups.items():
+                if value & single.value:
+                    group = group | single_group
+                    names.append(single.name)
+            self.assertEqual(backend.group, group, value)
+
+            base_repr = " | ".join(f"ManifestBackend.{name}" for name in names) or "ManifestBackend.NoBackend"
+            self.assertEqual(repr(backend), f"{base_repr} (group: {group!r})", value)
+            base_str = backend.name.lower() if backend.name is not None else " | ".join(names).lower()
+            self.assertEqual(str(backend), f"{base_str} (group: {str(group).replace(' | ', ', ')})", value)
+
+
+class TestManifestStrEnum(unittest.TestCase):
+
+    def test_compares_with_value(self):
+        # Members are str instances, they equal and hash like their plain value
+        self.assertEqual(Manifest.ObjectType.Module, "module")
+        self.assertEqual(Manifest.Status.Production, "Production")
+        self.assertNotEqual(Manifest.ObjectType.Module, "class")
+        self.assertIn("module", {Manifest.ObjectType.Module})
+        self.assertEqual({Manifest.Status.Development: 1}["Development"], 1)
+
+    def test_format(self):
+        self.assertEqual(str(Manifest.Status.Deprecated), "Deprecated")
+        self.assertEqual(repr(Manifest.ObjectType.Class), "class")
+        self.assertEqual(f"{Manifest.ObjectType.Function}", "function")
+
+
+class TestManifestVersion(unittest.TestCase):
+
+    def test_equal_versions(self):
+        # Versions compare and hash by their parsed value, not their text
+        self.assertEqual(Manifest.Version("1.0"), Manifest.Version("1.0.0"))
+        self.assertEqual(hash(Manifest.Version("1.0")), hash(Manifest.Version("1.0.0")))
+        self.assertNotEqual(Manifest.Version("1.0"), Manifest.Version("1.0.1"))
+
+    def test_parsed_version(self):
+        self.assertIsInstance(Manifest.Version("1.2.3").version, Version)
+        self.assertEqual(Manifest.Version(">=1.2").version, Version("1.2"))
+        self.assertEqual(Manifest.Version(">=1.2").direction, Manifest.Version.Direction.MINIMUM)
+        # Sorting uses the parsed versions, 0.10.0 is newer than 0.9.0
+        self.assertLess(Manifest.Version("0.9.0").version, Manifest.Version("0.10.0").version)
+
+
+if __name__ == '__main__':
+    unittest.main()